@@ -1,4 +1,6 @@
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
 
 from accounts.models import CustomUser
 
@@ -25,6 +27,23 @@ class CustomUserCreationForm(UserCreationForm):
             'age'
         )
 
+    def clean_email(self):
+        """
+        Rejects a non-blank email address already used by another user,
+        ignoring case, so the error is shown on the 'email' field.
+
+        :return: The cleaned email address.
+        """
+        email = self.cleaned_data.get('email')
+        if email and CustomUser.objects.filter(
+            email__iexact=email
+        ).exclude(pk=self.instance.pk).exists():
+            raise ValidationError(
+                _('A user with that email address already exists.'),
+                code='unique'
+            )
+        return email
+
 
 class CustomUserChangeForm(UserChangeForm):
     """
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-14 17:56
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Stop the migration, listing the affected email addresses, if several
+    users share a non-blank email address (ignoring case).
+
+    These users must be fixed by hand before the unique constraint can be
+    added, since only their owners know which address is the right one.
+    """
+    CustomUser = apps.get_model('accounts', 'CustomUser')
+    duplicate_emails = (
+        CustomUser.objects.exclude(email='')
+        .values(email_upper=Upper('email'))
+        .annotate(users_count=Count('pk'))
+        .filter(users_count__gt=1)
+        .values_list('email_upper', flat=True)
+    )
+    if duplicate_emails:
+        raise RuntimeError(
+            'Several users share each of these email addresses (ignoring '
+            'case), give them distinct addresses before migrating: '
+            + ', '.join(sorted(duplicate_emails))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='age',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(
+            code=check_duplicate_emails,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('email'), condition=models.Q(('email', ''), _negated=True), name='accounts_user_email_upper_unique', violation_error_message='A user with that email address already exists.'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
+from django.utils.translation import gettext_lazy as _
 
 
 class CustomUser(AbstractUser):
@@ -15,3 +18,23 @@ class CustomUser(AbstractUser):
         null=True,
         blank=True
     )
+
+    class Meta(AbstractUser.Meta):
+        """
+        Metadata for the CustomUser model.
+
+        Attributes:
+            constraints: A case-insensitive unique constraint on the non-blank
+                'email' values, so the 'email__iexact' lookup of the password
+                reset form finds a single user through its index.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                Upper('email'),
+                condition=~Q(email=''),
+                name='accounts_user_email_upper_unique',
+                violation_error_message=_(
+                    'A user with that email address already exists.'
+                )
+            )
+        ]
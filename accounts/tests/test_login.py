@@ -1,10 +1,18 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
-from django.test import TestCase
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse_lazy
 from django.utils import timezone
 
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
+
+
+@fast_password_hashers
 class LoginTestCase(TestCase):
     """
     A unit test case for the default login behavior in Django, which is
@@ -12,8 +20,8 @@ class LoginTestCase(TestCase):
     in, the error messages displayed, and the proper handling of user
     sessions.
     """
-    LOGIN_URL = reverse('login')
-    HOMEPAGE_URL = reverse('home')
+    LOGIN_URL = reverse_lazy('login')
+    HOMEPAGE_URL = reverse_lazy('home')
 
     @classmethod
     def setUpTestData(cls):
@@ -22,68 +30,74 @@ class LoginTestCase(TestCase):
         all unit tests. It is called only once for this test case, and the
         created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        cls.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
             age=18
         )
 
-        cls.user_2 = user_model.objects.create_user(
+        cls.user_2 = User.objects.create_user(
             username='test_user_2',
             password='test_pass',
             email='test_2@example.net',
             age=18
         )
 
-    def test_login_form_render_user_not_authenticated(self):
-        """
-        Checks that the login form renders are correct for a non-authenticated
-        user.
-        """
-        # HTTP Response
-        response = self.client.get(self.LOGIN_URL)
-
-        # Checks that an HTTP 200 (OK) status code is returned.
-        self.assertEqual(
-            first=response.status_code,
-            second=200
-        )
-
-        # Verify that the view renders the correct template.
-        self.assertTemplateUsed(
-            response=response,
-            template_name='registration/login.html'
-        )
-
-    def test_login_form_render_user_authenticated(self):
-        """
-        Checks that the login form renders are correct for an authenticated
-        user (example: for change accounts).
-        """
-        self.client.login(
+        # Session cookie of the test user, logged in only once for this test
+        # case to avoid running the password hasher in every unit test.
+        client = Client()
+        client.login(
             username='test_user',
             password='test_pass'
         )
+        cls.session_cookie = client.cookies[settings.SESSION_COOKIE_NAME].value
 
-        # HTTP Response
-        response = self.client.get(self.LOGIN_URL)
+    def setUp(self):
+        """
+        Clears the cache before each unit test, so the homepage is not served
+        from a page cached by a previous test.
+        """
+        cache.clear()
 
-        # Checks that an HTTP 200 (OK) status code is returned.
-        self.assertEqual(
-            first=response.status_code,
-            second=200
-        )
+    def login_test_user(self):
+        """
+        Authenticates the test client as the test user, reusing the session
+        cookie created in 'setUpTestData'.
+        """
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_cookie
 
-        # Verify that the view renders the correct template.
-        self.assertTemplateUsed(
-            response=response,
-            template_name='registration/login.html'
-        )
+    def test_login_form_render(self):
+        """
+        Checks that the login form renders are correct for a non-authenticated
+        user and for an authenticated user (example: for change accounts).
+        """
+        for authenticated in (False, True):
+            with self.subTest(authenticated=authenticated):
+                if authenticated:
+                    self.login_test_user()
+
+                # HTTP Response
+                response = self.client.get(self.LOGIN_URL)
+
+                # Checks that an HTTP 200 (OK) status code is returned.
+                self.assertEqual(
+                    first=response.status_code,
+                    second=200
+                )
+
+                # Checks that the user has the expected authentication status
+                self.assertEqual(
+                    first=response.context['user'].is_authenticated,
+                    second=authenticated
+                )
+
+                # Verify that the view renders the correct template.
+                self.assertTemplateUsed(
+                    response=response,
+                    template_name='registration/login.html'
+                )
 
     def test_valid_login_form_submit_user_not_authenticated(self):
         """
@@ -153,10 +167,7 @@ class LoginTestCase(TestCase):
         Checks that an authenticated user can submit the login form
         with valid data, for change to another account.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
+        self.login_test_user()
 
         login_data = {
             'username': 'test_user_2',
@@ -184,11 +195,12 @@ class LoginTestCase(TestCase):
             template_name='home.html'
         )
 
-        # Check that only are one session active
+        # Check that only are one session active (the query is limited to two
+        # rows, enough to tell one active session apart from several)
         active_sessions = Session.objects.filter(
             expire_date__gte=timezone.now()
-        )
+        )[:2]
         self.assertEqual(
-            first=active_sessions.count(),
+            first=len(active_sessions),
             second=1
         )
@@ -1,15 +1,23 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse_lazy
 
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
+
+
+@fast_password_hashers
 class LogoutTestCase(TestCase):
     """
     A unit test case for the default logout behavior in Django, which is
     included in the 'auth' package.
     """
-    LOGOUT_URL = reverse('logout')
-    HOMEPAGE_URL = reverse('home')
+    LOGOUT_URL = reverse_lazy('logout')
+    HOMEPAGE_URL = reverse_lazy('home')
 
     @classmethod
     def setUpTestData(cls):
@@ -18,24 +26,37 @@ class LogoutTestCase(TestCase):
         all unit tests. It is called only once for this test case, and the
         created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        cls.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
             age=18
         )
 
+        # Session cookie of the test user, logged in only once for this test
+        # case to avoid running the password hasher in every unit test.
+        client = Client()
+        client.login(
+            username='test_user',
+            password='test_pass'
+        )
+        cls.session_cookie = client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def setUp(self):
+        """
+        Clears the cache before each unit test, so the homepage is not served
+        from a page cached by a previous test.
+        """
+        cache.clear()
+
     def test_logout_user_not_authenticated(self):
         """
         Checks that the logout logic for non-authenticated users results in a
         redirect to the website homepage.
         """
         # HTTP Response
-        response = self.client.get(
+        response = self.client.post(
             path=self.LOGOUT_URL,
             follow=True
         )
@@ -59,13 +80,10 @@ class LogoutTestCase(TestCase):
         Checks that the logout logic for authenticated users results in a
         redirect to the website homepage and close the active session.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_cookie
 
         # HTTP Response
-        response = self.client.get(
+        response = self.client.post(
             path=self.LOGOUT_URL,
             follow=True
         )
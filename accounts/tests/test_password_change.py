@@ -1,28 +1,33 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import PasswordChangeForm
 from django.test import TestCase
-from django.urls import reverse
+from django.urls import reverse_lazy
 
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
+
+
+@fast_password_hashers
 class PasswordChangeTestCase(TestCase):
     """
     A unit test case for the default password change behavior in Django,
     that is included in the 'auth' package.
     """
-    LOGIN_URL = reverse('login')
-    PASSWORD_CHANGE_URL = reverse('password_change')
-    PASSWORD_CHANGE_DONE_URL = reverse('password_change_done')
+    LOGIN_URL = reverse_lazy('login')
+    PASSWORD_CHANGE_URL = reverse_lazy('password_change')
+    PASSWORD_CHANGE_DONE_URL = reverse_lazy('password_change_done')
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         This method creates objects in a test database that are available to
-        all unit tests. It is called before every unit test run.
+        all unit tests. It is called only once for this test case, and the
+        created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        self.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
@@ -147,9 +152,8 @@ class PasswordChangeTestCase(TestCase):
         )
 
         # Checks that the user password has changed
-        user_model = get_user_model()
-        user = user_model.objects.get(username='test_user')
-        self.assertTrue(expr=user.check_password('new_pass'))
+        self.user.refresh_from_db(fields=['password'])
+        self.assertTrue(expr=self.user.check_password('new_pass'))
 
         # Checks that the view renders the correct template.
         self.assertTemplateUsed(
@@ -204,6 +208,5 @@ class PasswordChangeTestCase(TestCase):
         )
 
         # Checks that the user password is the same
-        user_model = get_user_model()
-        user = user_model.objects.get(username='test_user')
-        self.assertTrue(expr=user.check_password('test_pass'))
+        self.user.refresh_from_db(fields=['password'])
+        self.assertTrue(expr=self.user.check_password('test_pass'))
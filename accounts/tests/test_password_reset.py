@@ -1,35 +1,70 @@
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import PasswordResetForm, SetPasswordForm
+from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
-from django.test import TestCase
-from django.urls import reverse
+from django.test import TestCase, override_settings
+from django.urls import reverse, reverse_lazy
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
 
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
+
+
+@fast_password_hashers
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    DEFAULT_FROM_EMAIL='test@example.net'
+)
 class PasswordResetTestCase(TestCase):
     """
     A unit test case for the default password reset behavior in Django,
     that is included in the 'auth' package.
     """
-    PASSWORD_RESET_URL = reverse('password_reset')
-    PASSWORD_RESET_DONE_URL = reverse('password_reset_done')
+    PASSWORD_RESET_URL = reverse_lazy('password_reset')
+    PASSWORD_RESET_DONE_URL = reverse_lazy('password_reset_done')
+    PASSWORD_RESET_COMPLETE_URL = reverse_lazy('password_reset_complete')
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         This method creates objects in a test database that are available to
-        all unit tests. It is called before every unit test run.
+        all unit tests. It is called only once for this test case, and the
+        created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        self.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
             age=18
         )
 
+        # Password reset link UID and token, built the same way as the ones
+        # sent in the password reset email.
+        cls.uid = urlsafe_base64_encode(force_bytes(cls.user.pk))
+        cls.token = default_token_generator.make_token(cls.user)
+
+        # Password reset confirm URLs for token validation and for
+        # establishing the new password.
+        cls.PASSWORD_RESET_CONFIRM_URL = reverse(
+            viewname='password_reset_confirm',
+            kwargs={
+                'uidb64': cls.uid,
+                'token': cls.token
+            }
+        )
+        cls.PASSWORD_RESET_SET_PASSWORD_URL = reverse(
+            viewname='password_reset_confirm',
+            kwargs={
+                'uidb64': cls.uid,
+                'token': 'set-password'
+            }
+        )
+
     def test_password_reset_form_render_user_not_authenticated(self):
         """
         Checks that a non-authenticated user can access the password reset form.
@@ -128,30 +163,9 @@ class PasswordResetTestCase(TestCase):
         Verify that a user that receives a password reset email can view
         the password reset form.
         """
-        # The password reset link UID and token are obtained from the email
-        reset_form_data = {
-            'email': 'test@example.net'
-        }
-
-        response = self.client.post(
-            path=self.PASSWORD_RESET_URL,
-            data=reset_form_data
-        )
-
-        uid = response.context[0]['uid']
-        token = response.context['token']
-
         # HTTP Response: GET Request to password reset confirm URL
-        reset_confirm_url = reverse(
-            viewname='password_reset_confirm',
-            kwargs={
-                'uidb64': uid,
-                'token': token
-            }
-        )
-
         response = self.client.get(
-            path=reset_confirm_url,
+            path=self.PASSWORD_RESET_CONFIRM_URL,
             follow=True
         )
 
@@ -178,46 +192,17 @@ class PasswordResetTestCase(TestCase):
         Checks that a user can send their new password using the 'password reset
         confirm' form.
         """
-        # The password reset link UID and token are obtained from the email
-        reset_form_data = {
-            'email': 'test@example.net'
-        }
-
-        response = self.client.post(
-            path=self.PASSWORD_RESET_URL,
-            data=reset_form_data
-        )
-
-        uid = response.context[0]['uid']
-        token = response.context['token']
-
         # HTTP Response: GET Request to password reset confirm URL
         # (for token validation)
-        reset_confirm_url = reverse(
-            viewname='password_reset_confirm',
-            kwargs={
-                'uidb64': uid,
-                'token': token
-            }
-        )
-
         self.client.get(
-            path=reset_confirm_url,
+            path=self.PASSWORD_RESET_CONFIRM_URL,
             follow=True
         )
 
         # HTTP Response for a POST Request to 'password reset confirms' URL
         # (to establish a new password).
-        reset_confirm_url = reverse(
-            viewname='password_reset_confirm',
-            kwargs={
-                'uidb64': uid,
-                'token': 'set-password'
-            }
-        )
-
         response = self.client.post(
-            path=reset_confirm_url,
+            path=self.PASSWORD_RESET_SET_PASSWORD_URL,
             data={
                 'new_password1': 'new_pass123',
                 'new_password2': 'new_pass123'
@@ -228,7 +213,7 @@ class PasswordResetTestCase(TestCase):
         # Checks that there is a redirect to the 'password_reset_complete' page
         self.assertRedirects(
             response=response,
-            expected_url=reverse('password_reset_complete'),
+            expected_url=self.PASSWORD_RESET_COMPLETE_URL,
             status_code=302,
             target_status_code=200
         )
@@ -240,56 +225,26 @@ class PasswordResetTestCase(TestCase):
         )
 
         # Verify that the user password has changed
-        user_model = get_user_model()
-        user = user_model.objects.get(username='test_user')
+        self.user.refresh_from_db(fields=['password'])
 
-        self.assertFalse(user.check_password('test_pass'))
+        self.assertFalse(self.user.check_password('test_pass'))
 
     def test_invalid_password_reset_confirm_form_submit(self):
         """
         Checks that a user cannot send their new password
         using the 'password reset confirm' form with invalid data.
         """
-        # The password reset link UID and token are obtained from the email
-        reset_form_data = {
-            'email': 'test@example.net'
-        }
-
-        response = self.client.post(
-            path=self.PASSWORD_RESET_URL,
-            data=reset_form_data
-        )
-
-        uid = response.context[0]['uid']
-        token = response.context['token']
-
         # HTTP Response: GET Request to password reset confirm URL
         # (for token validation)
-        reset_confirm_url = reverse(
-            viewname='password_reset_confirm',
-            kwargs={
-                'uidb64': uid,
-                'token': token
-            }
-        )
-
         self.client.get(
-            path=reset_confirm_url,
+            path=self.PASSWORD_RESET_CONFIRM_URL,
             follow=True
         )
 
         # HTTP Response for a POST Request to 'password reset confirms' URL
         # (to establish a new password).
-        reset_confirm_url = reverse(
-            viewname='password_reset_confirm',
-            kwargs={
-                'uidb64': uid,
-                'token': 'set-password'
-            }
-        )
-
         response = self.client.post(
-            path=reset_confirm_url,
+            path=self.PASSWORD_RESET_SET_PASSWORD_URL,
             data={
                 'new_password1': 'new_pass123',
                 'new_password2': 'another_pass'
@@ -321,6 +276,5 @@ class PasswordResetTestCase(TestCase):
         )
 
         # Checks that the user password is the same
-        user_model = get_user_model()
-        user = user_model.objects.get(username='test_user')
-        self.assertTrue(user.check_password('test_pass'))
+        self.user.refresh_from_db(fields=['password'])
+        self.assertTrue(self.user.check_password('test_pass'))
@@ -1,11 +1,15 @@
 from django.contrib.auth import get_user_model
-from django.forms import model_to_dict
 from django.test import TestCase
 from django.urls import reverse
 
 from accounts.forms import CustomUserCreationForm
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
 
+
+@fast_password_hashers
 class SignupPageTestCase(TestCase):
     """
     Unit test case for the 'SignUpView' class that handles user signup in the
@@ -16,16 +20,15 @@ class SignupPageTestCase(TestCase):
     SIGNUP_URL = reverse('signup')
     LOGIN_URL = reverse('login')
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         This method creates objects in a test database that are available to
-        all unit tests. It is called before every unit test run.
+        all unit tests. It is called only once for this test case, and the
+        created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        self.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
@@ -36,10 +39,7 @@ class SignupPageTestCase(TestCase):
         """
         Checks that an authenticated user cannot access the signup form.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
+        self.client.force_login(user=self.user)
 
         # HTTP Response
         response = self.client.get(path=self.SIGNUP_URL)
@@ -79,10 +79,7 @@ class SignupPageTestCase(TestCase):
         """
         Checks that an authenticated user cannot submit the user signup form.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
+        self.client.force_login(user=self.user)
 
         # New user data
         form_data = {
@@ -106,9 +103,8 @@ class SignupPageTestCase(TestCase):
         )
 
         # Checks that there are no new users in the database.
-        user_model = get_user_model()
         self.assertEqual(
-            first=user_model.objects.all().count(),
+            first=User.objects.count(),
             second=1
         )
 
@@ -116,9 +112,6 @@ class SignupPageTestCase(TestCase):
         """
         Checks that a non-authenticated user can submit the user signup form.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # New user data
         form_data = {
             'username': 'test_user_2',
@@ -137,22 +130,19 @@ class SignupPageTestCase(TestCase):
 
         # Checks that the form submit adds a new user to the test database.
         self.assertEqual(
-            first=user_model.objects.count(),
+            first=User.objects.count(),
             second=2
         )
 
         # Checks if the new user has the correct info.
-        new_user = user_model.objects.get(
+        new_user = User.objects.get(
             username=form_data['username']
         )
-        new_user_partial_data = model_to_dict(
-            instance=new_user,
-            fields=['username', 'email', 'age']
-        )
-        self.assertEqual(
-            first={key: form_data[key] for key in ['username', 'email', 'age']},
-            second=new_user_partial_data
-        )
+        for field in ('username', 'email', 'age'):
+            self.assertEqual(
+                first=getattr(new_user, field),
+                second=form_data[field]
+            )
 
         # Verifies that there is a redirect to the login page after
         # the new user is registered.
@@ -169,8 +159,75 @@ class SignupPageTestCase(TestCase):
             template_name='registration/login.html'
         )
 
-        # Checks that exist a new user in the database
+    def test_signup_form_submit_duplicate_email(self):
+        """
+        Checks that the user signup form rejects an email address already
+        used by another user, even if it only differs in case.
+        """
+        # New user data, with the test user email in upper case
+        form_data = {
+            'username': 'test_user_2',
+            'email': 'TEST@example.net',
+            'age': 21,
+            'password1': 'user12345',
+            'password2': 'user12345'
+        }
+
+        # HTTP Response
+        response = self.client.post(
+            path=self.SIGNUP_URL,
+            data=form_data
+        )
+
+        # Checks that the form is rendered again with the email error.
         self.assertEqual(
-            first=user_model.objects.all().count(),
-            second=2
+            first=response.status_code,
+            second=200
+        )
+        self.assertIn(
+            member='A user with that email address already exists.',
+            container=response.context['form'].errors['email']
+        )
+
+        # Checks that there are no new users in the database.
+        self.assertEqual(
+            first=User.objects.count(),
+            second=1
+        )
+
+    def test_signup_form_submit_blank_email(self):
+        """
+        Checks that the user signup form accepts a blank email address, even
+        if another user has no email address either.
+        """
+        User.objects.create_user(
+            username='test_user_2',
+            password='user12345'
+        )
+
+        # New user data, without an email address
+        form_data = {
+            'username': 'test_user_3',
+            'email': '',
+            'age': 21,
+            'password1': 'user12345',
+            'password2': 'user12345'
+        }
+
+        # HTTP Response
+        response = self.client.post(
+            path=self.SIGNUP_URL,
+            data=form_data
+        )
+
+        # Checks that the user is redirected to the login page.
+        self.assertRedirects(
+            response=response,
+            expected_url=self.LOGIN_URL
+        )
+
+        # Checks that the new user is saved to the database.
+        self.assertEqual(
+            first=User.objects.count(),
+            second=3
         )
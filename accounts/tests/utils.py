@@ -0,0 +1,8 @@
+from django.test import override_settings
+
+# Test case class decorator that replaces the default password hasher with
+# the much faster, but insecure, MD5 hasher, since every created test user and
+# every login hashes a password.
+fast_password_hashers = override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
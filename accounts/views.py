@@ -1,14 +1,39 @@
-from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.exceptions import PermissionDenied
 from django.urls import reverse_lazy
 from django.views.generic import CreateView
 
 from accounts.forms import CustomUserCreationForm
 
 
-class SignUpView(UserPassesTestMixin, CreateView):
+class AnonymousRequiredMixin:
+    """
+    A class-based view mixin that only allows non-authenticated users to
+    access the view.
+
+    It checks the user authentication status once, in the 'dispatch' method,
+    instead of going through the 'UserPassesTestMixin' test function lookup.
+    Authenticated users get an HTTP 403 (Forbidden) response.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Rejects the request if the current user has been authenticated, and
+        calls the parent's implementation of the method otherwise.
+
+        :param request: The incoming request.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: The HTTP response.
+        """
+        if request.user.is_authenticated:
+            raise PermissionDenied
+        return super().dispatch(request, *args, **kwargs)
+
+
+class SignUpView(AnonymousRequiredMixin, CreateView):
     """
     A class-based view that inherits from Django generic 'CreateView' view
-    and uses the 'UserPassesTestMixin' mixin and implements the user signup
+    and uses the 'AnonymousRequiredMixin' mixin and implements the user signup
     logic exclusively for non-authenticated users.
 
     Attributes:
@@ -19,14 +44,3 @@ class SignUpView(UserPassesTestMixin, CreateView):
     form_class = CustomUserCreationForm
     success_url = reverse_lazy('login')
     template_name = 'registration/signup.html'
-
-    def test_func(self):
-        """
-        A method that implements the user validation logic before allowing
-        registration.
-        In this case, it checks if the current user has not been
-        authenticated.
-        :return: True if the current user has not been authenticated.
-        False otherwise.
-        """
-        return not self.request.user.is_authenticated
@@ -13,8 +13,11 @@ class CommentInline(admin.TabularInline):
 
     Attributes:
         model: The inline class base model.
+        raw_id_fields: Foreign key fields shown as an ID input instead of a
+            select box listing every user, one per comment row.
     """
     model = Comment
+    raw_id_fields = ('author', )
 
 
 class ArticleAdmin(admin.ModelAdmin):
@@ -28,8 +31,11 @@ class ArticleAdmin(admin.ModelAdmin):
 
     Attributes:
         inlines: A list of inline classes to use with the Article model.
+        raw_id_fields: Foreign key fields shown as an ID input instead of a
+            select box listing every user.
     """
     inlines = [CommentInline]
+    raw_id_fields = ('author', )
 
 
 admin.site.register(Article, ArticleAdmin)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-14 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='article',
+            options={'ordering': ['-date']},
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='body',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='date',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='title',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='comment',
+            field=models.CharField(max_length=150),
+        ),
+    ]
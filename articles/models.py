@@ -3,6 +3,46 @@ from django.db import models
 from django.urls import reverse
 
 
+class ArticleManager(models.Manager):
+    """
+    The default manager of the 'Article' model.
+
+    Its querysets join the article author in the same query, since every
+    article list and detail page shows it.
+    """
+    def get_queryset(self):
+        """
+        It returns the base queryset of the manager, including the article
+        author in the query.
+        :return: A queryset of 'Article' objects with their author.
+        """
+        return super().get_queryset().select_related('author')
+
+    def with_comments(self):
+        """
+        It returns a queryset of articles that also fetches their comments
+        (and the comment authors) using a single extra query.
+        :return: A queryset of 'Article' objects with their comments.
+        """
+        return self.get_queryset().prefetch_related('comment_set')
+
+
+class CommentManager(models.Manager):
+    """
+    The default manager of the 'Comment' model.
+
+    Its querysets join the comment author in the same query, since the
+    comments are always shown along with their author.
+    """
+    def get_queryset(self):
+        """
+        It returns the base queryset of the manager, including the comment
+        author in the query.
+        :return: A queryset of 'Comment' objects with their author.
+        """
+        return super().get_queryset().select_related('author')
+
+
 class Article(models.Model):
     """
     A model that represents a newspaper article.
@@ -10,7 +50,8 @@ class Article(models.Model):
     Attributes:
         title: The title of the article.
         body: The body or content of the article.
-        date: The article creation date and time.
+        date: The article creation date and time. It is indexed, since the
+            articles are sorted by this field.
         author: The user who is the author of the article.
     """
     title = models.CharField(
@@ -18,13 +59,25 @@ class Article(models.Model):
     )
     body = models.TextField()
     date = models.DateTimeField(
-        auto_now_add=True
+        auto_now_add=True,
+        db_index=True
     )
     author = models.ForeignKey(
         to=settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
     )
 
+    objects = ArticleManager()
+
+    class Meta:
+        """
+        Metadata for the Article model.
+
+        Attributes:
+            ordering: The default ordering of the articles, newest first.
+        """
+        ordering = ['-date']
+
     def __str__(self):
         """
         It returns the string representation of an 'Article' object.
@@ -49,9 +102,18 @@ class Article(models.Model):
 class Comment(models.Model):
     """
     A model that represents a comment made on a newspaper article.
+
+    Attributes:
+        comment: The comment content. It is not indexed on purpose: no query
+            filters on it, and a 150 characters index key would be large on
+            some databases (600 bytes with MySQL utf8mb4).
+        article: The commented article. As a foreign key, it is indexed by
+            Django, which covers the comment listing of an article.
+        author: The user who is the author of the comment.
     """
     comment = models.CharField(
-        max_length=150
+        max_length=150,
+        db_index=False
     )
     article = models.ForeignKey(
         to=Article,
@@ -62,6 +124,8 @@ class Comment(models.Model):
         on_delete=models.CASCADE
     )
 
+    objects = CommentManager()
+
     def __str__(self):
         """
         It returns the string representation of a 'Comment' object.
@@ -1,13 +1,18 @@
-from django.contrib.auth import get_user_model
-from django.forms import ModelForm, model_to_dict
-from django.test import TestCase
-from django.urls import reverse
+from django.forms import ModelForm
+from django.test import SimpleTestCase, TestCase
 
+from accounts.tests.utils import fast_password_hashers
 from articles.models import Article
-from articles.tests.utils import TestUtils
+from articles.tests.utils import (
+    NEW_ARTICLE_URL,
+    ArticleTestDataMixin,
+    check_login_redirect,
+    login_with_session_cookie
+)
 
 
-class ArticleCreateTestCase(TestCase):
+@fast_password_hashers
+class ArticleCreateTestCase(ArticleTestDataMixin, TestCase):
     """
     A Django 'TestCase' subclass that contains unit tests for the
     'ArticleCreateView' view.
@@ -16,63 +21,6 @@ class ArticleCreateTestCase(TestCase):
     the expected HTTP response codes, rendering the correct templates, and
     allowing new article creation.
     """
-    # URLs
-    LOGIN_URL = reverse('login')
-    NEW_ARTICLE_URL = reverse('article_new')
-    ARTICLE_DETAIL_URL = reverse(
-        'article_detail',
-        kwargs={
-            'pk': 1
-        }
-    )
-
-    # Utility methods
-    utils = TestUtils()
-
-    @classmethod
-    def setUpTestData(cls):
-        """
-        Before the execution of all test methods in the 'ArticleCreateTestCase'
-        class, this method is run and set up the test data that all the tests
-        will use.
-
-        This method creates a test user and article using the Django ORM.
-        These test objects are saved to the database and can be used in the
-        tests to ensure that the 'ArticleCreateView' view is functioning
-        correctly.
-        """
-        # Project custom user model
-        user_model = get_user_model()
-
-        # Test user
-        cls.user = user_model.objects.create_user(
-            username='test_user',
-            password='test_pass',
-            email='test@example.net',
-            age=18
-        )
-
-    def test_create_form_render_user_not_authenticated(self):
-        """
-        This method tests the behavior of the "ArticleCreateView" view for
-        non-authenticated users.
-
-        It sends an HTTP GET request to the "ArticleCreateView" view URL and
-        verifies that the view redirects to the login page as expected.
-        It also checks the proper template render.
-        """
-        # HTTP Response
-        response = self.client.get(
-            path=self.NEW_ARTICLE_URL,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.NEW_ARTICLE_URL
-        )
-
     def test_create_form_render_user_authenticated(self):
         """
         This method tests the behavior of the "ArticleCreateView" view for
@@ -84,13 +32,13 @@ class ArticleCreateTestCase(TestCase):
         correct template and sends a 'ModelForm' form in the context.
         """
 
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         # HTTP Response
-        response = self.client.get(path=self.NEW_ARTICLE_URL)
+        response = self.client.get(path=NEW_ARTICLE_URL)
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -128,15 +76,15 @@ class ArticleCreateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.NEW_ARTICLE_URL,
-            data=new_article_data,
-            follow=True
+            path=NEW_ARTICLE_URL,
+            data=new_article_data
         )
 
         # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
+        check_login_redirect(
+            testcase=self,
             response=response,
-            target_url=self.NEW_ARTICLE_URL
+            target_url=NEW_ARTICLE_URL
         )
 
         # Checks that no articles were saved to the database
@@ -151,13 +99,14 @@ class ArticleCreateTestCase(TestCase):
         when an authenticated user submits a form to create a new article.
 
         It sends an HTTP POST request to the "ArticleCreateView" view URL with
-        the new article data and verifies that the view redirects to the article
-        details page as expected. It also checks that there is a new article
-        in the database.
+        the new article data and checks that there is a new article in the
+        database. The redirect to the article details page is checked last,
+        so a failed database check skips the details page render (which is
+        tested by the 'ArticleDetailTestCase' test case).
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         new_article_data = {
@@ -167,17 +116,8 @@ class ArticleCreateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.NEW_ARTICLE_URL,
-            data=new_article_data,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the article detail page
-        self.assertRedirects(
-            response=response,
-            expected_url=self.ARTICLE_DETAIL_URL,
-            status_code=302,
-            target_status_code=200
+            path=NEW_ARTICLE_URL,
+            data=new_article_data
         )
 
         # Checks that the article was saved in the database
@@ -185,18 +125,14 @@ class ArticleCreateTestCase(TestCase):
             first=Article.objects.count(),
             second=1
         )
+        article = Article.objects.get()
 
         # Checks that the created article contains the correct form data
-        article = Article.objects.get(pk=1)
-        article_partial_data = model_to_dict(
-            instance=article,
-            fields=['title', 'body']
-        )
-
-        self.assertEqual(
-            first=article_partial_data,
-            second=new_article_data
-        )
+        for field in ('title', 'body'):
+            self.assertEqual(
+                first=getattr(article, field),
+                second=new_article_data[field]
+            )
 
         # Checks that the article author is the currently authenticated user
         self.assertEqual(
@@ -204,16 +140,12 @@ class ArticleCreateTestCase(TestCase):
             second=self.user
         )
 
-        # Checks that the view renders the correct template.
-        self.assertTemplateUsed(
+        # Checks that there is a redirect to the created article detail page
+        self.assertRedirects(
             response=response,
-            template_name='articles/article_detail.html'
-        )
-
-        # Checks that the view sends the correct 'Article' object in the context
-        self.assertEqual(
-            first=response.context['article'],
-            second=article
+            expected_url=article.get_absolute_url(),
+            status_code=302,
+            target_status_code=200
         )
 
     def test_create_form_invalid_submit_user_authenticated(self):
@@ -227,9 +159,9 @@ class ArticleCreateTestCase(TestCase):
         shows the article creation form with error messages. It also checks
         that there are no new articles in the database.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         new_article_data = {
@@ -239,7 +171,7 @@ class ArticleCreateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.NEW_ARTICLE_URL,
+            path=NEW_ARTICLE_URL,
             data=new_article_data
         )
 
@@ -277,3 +209,24 @@ class ArticleCreateTestCase(TestCase):
             first=Article.objects.count(),
             second=0
         )
+
+
+class ArticleCreateAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'ArticleCreateView' view for anonymous users."""
+    def test_create_form_render_user_not_authenticated(self):
+        """
+        This method tests the behavior of the "ArticleCreateView" view for
+        non-authenticated users.
+
+        It sends an HTTP GET request to the "ArticleCreateView" view URL and
+        verifies that the view redirects to the login page as expected.
+        """
+        # HTTP Response
+        response = self.client.get(path=NEW_ARTICLE_URL)
+
+        # Checks that there is a redirect to the login page
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=NEW_ARTICLE_URL
+        )
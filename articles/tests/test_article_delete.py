@@ -1,28 +1,34 @@
 from django.contrib.auth import get_user_model
 from django.forms import Form
-from django.test import TestCase
-from django.urls import reverse
+from django.test import RequestFactory, SimpleTestCase, TestCase
 
+from accounts.tests.utils import fast_password_hashers
 from articles.models import Article
-from articles.tests.utils import TestUtils
-
-
-class ArticleDeleteTestCase(TestCase):
+from articles.tests.utils import (
+    ARTICLE_DELETE_URL,
+    ARTICLE_LIST_URL,
+    ArticleTestDataMixin,
+    check_login_redirect,
+    create_session_cookie,
+    login_with_session_cookie
+)
+from articles.views import ArticleDeleteView
+
+# Project custom user model
+User = get_user_model()
+
+
+@fast_password_hashers
+class ArticleDeleteTestCase(ArticleTestDataMixin, TestCase):
     """
-
+    A Django 'TestCase' subclass that contains unit tests for the
+    'ArticleDeleteView' view.
     """
-    # URLs
-    LOGIN_URL = reverse('login')
-    ARTICLE_LIST_URL = reverse('article_list')
-    ARTICLE_DELETE_URL = reverse(
-        viewname='article_delete',
-        kwargs={
-            'pk': 1
-        }
-    )
-
-    # Utility methods
-    utils = TestUtils()
+    # Request factory for the tests that only check the view response,
+    # calling the view directly without the middleware stack
+    factory = RequestFactory()
+
+    create_article = True
 
     @classmethod
     def setUpTestData(cls):
@@ -31,56 +37,25 @@ class ArticleDeleteTestCase(TestCase):
         class, this method is run and set up the test data that all the tests
         will use.
 
-        This method creates a test user and article using the Django ORM.
+        This method adds a second test user, created using the Django ORM, to
+        the test user and article set up by 'ArticleTestDataMixin'.
         These test objects are saved to the database and can be used in the
         tests to ensure that the 'ArticleDeleteView' view is functioning
         correctly.
         """
-        # Project custom user model
-        user_model = get_user_model()
+        super().setUpTestData()
 
-        # Test user
-        cls.user = user_model.objects.create_user(
-            username='test_user',
-            password='test_pass',
-            email='test@example.net',
-            age=18
-        )
-
-        cls.user_2 = user_model.objects.create_user(
+        # Second test user, not the author of the test article
+        cls.user_2 = User.objects.create_user(
             username='test_user_2',
             password='test_pass',
             email='test2@example.net',
             age=81
         )
 
-        # Test article
-        cls.test_article = Article.objects.create(
-            pk=1,
-            title='Test Article',
-            body='Test Body',
-            author=cls.user
-        )
-
-    def test_delete_confirm_render_user_not_authenticated(self):
-        """
-        This method tests the behavior of the "ArticleDeleteView" view when a
-        non-authenticated user tries to access an article delete confirm page.
-
-        It sends an HTTP GET request to the "ArticleDeleteView" view URL and
-        verifies that the view redirects to the login page as expected.
-        """
-        # HTTP Response
-        response = self.client.get(
-            path=self.ARTICLE_DELETE_URL,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.ARTICLE_DELETE_URL
-        )
+        # Session cookie of the second test user, logged in only once for
+        # this test case
+        cls.session_cookie_2 = create_session_cookie(user=cls.user_2)
 
     def test_delete_confirm_render_user_not_authorized(self):
         """
@@ -92,13 +67,13 @@ class ArticleDeleteTestCase(TestCase):
         verifies that the server returns an HTTP 403 status code as expected.
         """
         # Log in with the second test user
-        self.client.login(
-            username='test_user_2',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie_2
         )
 
         # HTTP Response
-        response = self.client.get(path=self.ARTICLE_DELETE_URL)
+        response = self.client.get(path=ARTICLE_DELETE_URL)
 
         # Checks that an HTTP 403 (Forbidden) status code is returned.
         self.assertEqual(
@@ -117,13 +92,15 @@ class ArticleDeleteTestCase(TestCase):
         as expected.
         """
         # Log in with the first test user
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
-        # HTTP Response
-        response = self.client.get(path=self.ARTICLE_DELETE_URL)
+        # HTTP Response, checking the number of database queries: session,
+        # user and article, retrieved only once.
+        with self.assertNumQueries(3):
+            response = self.client.get(path=ARTICLE_DELETE_URL)
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -152,15 +129,13 @@ class ArticleDeleteTestCase(TestCase):
         verifies that the view redirects to the login page as expected.
         """
         # HTTP Response
-        response = self.client.post(
-            path=self.ARTICLE_DELETE_URL,
-            follow=True
-        )
+        response = self.client.post(path=ARTICLE_DELETE_URL)
 
         # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
+        check_login_redirect(
+            testcase=self,
             response=response,
-            target_url=self.ARTICLE_DELETE_URL
+            target_url=ARTICLE_DELETE_URL
         )
 
         # Checks that the article has not been deleted
@@ -179,13 +154,13 @@ class ArticleDeleteTestCase(TestCase):
         verifies that the server returns an HTTP 403 status code as expected.
         """
         # Log in with the second test user
-        self.client.login(
-            username='test_user_2',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie_2
         )
 
         # HTTP Response
-        response = self.client.post(path=self.ARTICLE_DELETE_URL)
+        response = self.client.post(path=ARTICLE_DELETE_URL)
 
         # Checks that an HTTP 403 (Forbidden) status code is returned.
         self.assertEqual(
@@ -204,21 +179,21 @@ class ArticleDeleteTestCase(TestCase):
         to the article list page as expected.
         """
         # Log in with the fist test user
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         # HTTP Response
         response = self.client.post(
-            path=self.ARTICLE_DELETE_URL,
+            path=ARTICLE_DELETE_URL,
             follow=True
         )
 
         # Checks that there is a redirect to the article list page
         self.assertRedirects(
             response=response,
-            expected_url=self.ARTICLE_LIST_URL,
+            expected_url=ARTICLE_LIST_URL,
             status_code=302,
             target_status_code=200
         )
@@ -234,3 +209,52 @@ class ArticleDeleteTestCase(TestCase):
             first=Article.objects.count(),
             second=0
         )
+
+    def test_delete_confirm_submit_queries_user_authorized(self):
+        """
+        This method tests the number of database queries of the
+        "ArticleDeleteView" view when an authenticated user submits an article
+        delete confirmation for an article that is of their authorship.
+
+        It calls the "ArticleDeleteView" view with an HTTP POST request built by
+        the request factory and checks that the article is retrieved only once,
+        for both the author check and the deletion.
+        """
+        request = self.factory.post(path=ARTICLE_DELETE_URL)
+        request.user = self.user
+
+        # HTTP Response, checking the number of database queries: article
+        # retrieval, and deletion of its comments and itself.
+        with self.assertNumQueries(3):
+            response = ArticleDeleteView.as_view()(request, pk=1)
+
+        # Checks that there is a redirect to the article list page
+        self.assertEqual(
+            first=response.status_code,
+            second=302
+        )
+        self.assertEqual(
+            first=response.url,
+            second=ARTICLE_LIST_URL
+        )
+
+
+class ArticleDeleteAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'ArticleDeleteView' view for anonymous users."""
+    def test_delete_confirm_render_user_not_authenticated(self):
+        """
+        This method tests the behavior of the "ArticleDeleteView" view when a
+        non-authenticated user tries to access an article delete confirm page.
+
+        It sends an HTTP GET request to the "ArticleDeleteView" view URL and
+        verifies that the view redirects to the login page as expected.
+        """
+        # HTTP Response
+        response = self.client.get(path=ARTICLE_DELETE_URL)
+
+        # Checks that there is a redirect to the login page
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=ARTICLE_DELETE_URL
+        )
@@ -1,13 +1,27 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase
+)
 
+from accounts.tests.utils import fast_password_hashers
 from articles.forms import CommentForm
-from articles.models import Article, Comment
-from articles.tests.utils import TestUtils
+from articles.models import Comment
+from articles.tests.utils import (
+    ARTICLE_DETAIL_URL,
+    ArticleTestDataMixin,
+    check_login_redirect,
+    login_with_session_cookie
+)
+from articles.views import ArticleDetailView
 
+# Project custom user model
+User = get_user_model()
 
-class ArticleDetailTestCase(TestCase):
+
+@fast_password_hashers
+class ArticleDetailTestCase(ArticleTestDataMixin, TestCase):
     """
     A Django 'TestCase' subclass that contains unit tests for the
     'ArticleDetailView' view.
@@ -16,67 +30,39 @@ class ArticleDetailTestCase(TestCase):
     expected HTTP response codes, rendering the correct templates, and
     displaying the details of a specific article.
     """
-    # URLS
-    LOGIN_URL = reverse('login')
-    ARTICLE_DETAIL_URL = reverse(
-        'article_detail',
-        kwargs={
-            'pk': 1
-        }
-    )
-    # Utility methods
-    utils = TestUtils()
+    # Request factory for the tests that only check the view response and
+    # context, calling the view directly without the middleware stack
+    factory = RequestFactory()
+
+    create_article = True
 
     @classmethod
     def setUpTestData(cls):
         """
-        Before the execution of all test methods in the 'ArticleDetailTestCase'
-        class, this method is run and set up the test data that all the tests
-        will use.
-
-        This method creates a test user and article using the Django ORM.
-        These test objects are saved to the database and can be used in the
-        tests to ensure that the 'ArticleListView' view is functioning
-        correctly.
-        """
-        # Project custom user model
-        user_model = get_user_model()
-
-        # Test user
-        cls.user = user_model.objects.create_user(
-            username='test_user',
-            password='test_pass',
-            email='test@example.net',
-            age=18
-        )
-
-        # Test article
-        Article.objects.create(
-            pk=1,
-            title='Test Article',
-            body='Test Body',
-            author=cls.user
-        )
-
-    def test_article_details_user_not_authenticated(self):
-        """
-        This method tests the behavior of the "ArticleDetailView" view for
-        non-authenticated users.
-
-        It sends an HTTP GET request to the "ArticleDetailView" URL and verifies
-        that the view redirects to the login page as expected. It also checks
-        the proper template render.
+        Adds two comments to the test article set up by 'ArticleTestDataMixin',
+        each one by a different commenter, so the query count checks fail if
+        the comment authors are loaded with a query per comment.
         """
-        # Http Response
-        response = self.client.get(
-            path=self.ARTICLE_DETAIL_URL,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.ARTICLE_DETAIL_URL
+        super().setUpTestData()
+
+        # Test commenters, not the author of the test article
+        commenters = [
+            User.objects.create_user(
+                username=f'test_commenter_{number}',
+                password='test_pass',
+                email=f'commenter{number}@example.net'
+            )
+            for number in (1, 2)
+        ]
+
+        # Test article comments
+        cls.comments = Comment.objects.bulk_create(
+            Comment(
+                comment=f'Test Comment by {commenter.username}',
+                article=cls.article,
+                author=commenter
+            )
+            for commenter in commenters
         )
 
     def test_article_detail_user_authenticated(self):
@@ -84,19 +70,36 @@ class ArticleDetailTestCase(TestCase):
         This method tests the behavior of the "ArticleDetailView" view for
         authenticated users.
 
-        It sends an HTTP GET request to the "ArticleDetailView" URL and verifies
-        that the view shows the article detail page as expected.
+        It calls the "ArticleDetailView" view with an HTTP GET request built by
+        the request factory and verifies that the view shows the article
+        detail page as expected.
 
         It also checks the proper template render and the article and comment
         form included in the view context.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
-
-        # HTTP Response
-        response = self.client.get(path=self.ARTICLE_DETAIL_URL)
+        request = self.factory.get(path=ARTICLE_DETAIL_URL)
+        request.user = self.user
+
+        # HTTP Response, checking that the view renders the correct template
+        # with the expected number of database queries (article and comments,
+        # along with their authors).
+        with self.assertNumQueries(2):
+            response = ArticleDetailView.as_view()(request, pk=1)
+            with self.assertTemplateUsed(
+                template_name='articles/article_detail.html'
+            ):
+                response.render()
+
+        # Checks that the test comments are rendered with their authors
+        for comment in self.comments:
+            self.assertContains(
+                response=response,
+                text=comment.comment
+            )
+            self.assertContains(
+                response=response,
+                text=comment.author.username
+            )
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -104,49 +107,18 @@ class ArticleDetailTestCase(TestCase):
             second=200
         )
 
-        # Checks that the view renders the correct template.
-        self.assertTemplateUsed(
-            response=response,
-            template_name='articles/article_detail.html'
-        )
-
         # Checks that the view sends the correct 'Article' object in the context
         self.assertEqual(
-            first=response.context['article'],
-            second=Article.objects.get(pk=1)
+            first=response.context_data['article'],
+            second=self.article
         )
 
         # Checks that the view sends a 'CommentForm' form in the context
         self.assertIsInstance(
-            obj=response.context['form'],
+            obj=response.context_data['form'],
             cls=CommentForm
         )
 
-    def test_add_comment_user_not_authenticated(self):
-        """
-        Checks that non-authenticated users are redirected to the login page
-        when attempting to add a comment to an article.
-
-        This test sends an HTTP POST request to the "ArticleDetailView" URL
-        with comment data for a non-authenticated user and verifies that
-        there is a redirect to the login page.
-        """
-        comment_data = {
-            'comment': 'some comment'
-        }
-
-        # HTTP Response
-        response = self.client.post(
-            path=self.ARTICLE_DETAIL_URL,
-            data=comment_data,
-            follow=True
-        )
-
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.ARTICLE_DETAIL_URL
-        )
-
     def test_add_valid_comment_user_authenticated(self):
         """
         Checks that authenticated users can add valid comments to an article.
@@ -154,9 +126,9 @@ class ArticleDetailTestCase(TestCase):
         This test logs with an authenticated user and send an HTTP POST request
         to the "ArticleDetailView" URL with valid comment data.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         comment_data = {
@@ -165,7 +137,7 @@ class ArticleDetailTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.ARTICLE_DETAIL_URL,
+            path=ARTICLE_DETAIL_URL,
             data=comment_data,
             follow=True
         )
@@ -173,28 +145,33 @@ class ArticleDetailTestCase(TestCase):
         # Checks that there is a redirect to the article detail page
         self.assertRedirects(
             response=response,
-            expected_url=self.ARTICLE_DETAIL_URL,
+            expected_url=ARTICLE_DETAIL_URL,
             status_code=302,
             target_status_code=200
         )
 
-        # Checks that the comment is saved in the database
+        # Checks that the comment is saved in the database, along with the
+        # test comments
         self.assertEqual(
             first=Comment.objects.count(),
-            second=1
+            second=len(self.comments) + 1
+        )
+
+        # Saved comment, fetched along with its author and article
+        comment = Comment.objects.select_related('author', 'article').get(
+            comment='some valid comment'
         )
 
         # Checks that the comment author is the current logged user
-        user_model = get_user_model()
         self.assertEqual(
-            first=Comment.objects.get(pk=1).author,
-            second=user_model.objects.get(username='test_user')
+            first=comment.author,
+            second=self.user
         )
 
         # Checks that the commented article is the correct
         self.assertEqual(
-            first=Comment.objects.get(pk=1).article,
-            second=Article.objects.get(pk=1)
+            first=comment.article,
+            second=self.article
         )
 
         # Checks that the view renders the correct template.
@@ -214,23 +191,25 @@ class ArticleDetailTestCase(TestCase):
         Checks that authenticated users cannot add invalid comments
         to an article.
 
-        This test logs with an authenticated user and send an HTTP POST request
-        to the "ArticleDetailView" URL with invalid comment data.
+        This test calls the "ArticleDetailView" view with an HTTP POST request
+        built by the request factory for an authenticated user, with invalid
+        comment data.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
-
         invalid_comment_data = {
             'comment': ''
         }
-
-        # HTTP Response
-        response = self.client.post(
-            path=self.ARTICLE_DETAIL_URL,
+        request = self.factory.post(
+            path=ARTICLE_DETAIL_URL,
             data=invalid_comment_data
         )
+        request.user = self.user
+
+        # HTTP Response, checking that the page is rendered again with the
+        # expected number of database queries (article and comments, along
+        # with their authors).
+        with self.assertNumQueries(2):
+            response = ArticleDetailView.as_view()(request, pk=1)
+            response.render()
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -240,23 +219,69 @@ class ArticleDetailTestCase(TestCase):
 
         # Checks that the view sends the correct 'Article' object in the context
         self.assertEqual(
-            first=response.context['article'],
-            second=Article.objects.get(pk=1)
+            first=response.context_data['article'],
+            second=self.article
         )
 
         # Checks that the view sends a 'CommentForm' form in the context
         self.assertIsInstance(
-            obj=response.context['form'],
+            obj=response.context_data['form'],
             cls=CommentForm
         )
 
         # Checks that the comment form has errors
         self.assertTrue(
-            expr=response.context['form'].errors
+            expr=response.context_data['form'].errors
         )
 
         # Checks that the comment form has an error in the 'comment' field
         self.assertIn(
             member='comment',
-            container=response.context['form'].errors
+            container=response.context_data['form'].errors
+        )
+
+
+class ArticleDetailAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'ArticleDetailView' view for anonymous users."""
+    def test_article_details_user_not_authenticated(self):
+        """
+        This method tests the behavior of the "ArticleDetailView" view for
+        non-authenticated users.
+
+        It sends an HTTP GET request to the "ArticleDetailView" URL and verifies
+        that the view redirects to the login page as expected.
+        """
+        # Http Response
+        response = self.client.get(path=ARTICLE_DETAIL_URL)
+
+        # Checks that there is a redirect to the login page
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=ARTICLE_DETAIL_URL
+        )
+
+    def test_add_comment_user_not_authenticated(self):
+        """
+        Checks that non-authenticated users are redirected to the login page
+        when attempting to add a comment to an article.
+
+        This test sends an HTTP POST request to the "ArticleDetailView" URL
+        with comment data for a non-authenticated user and verifies that
+        there is a redirect to the login page.
+        """
+        comment_data = {
+            'comment': 'some comment'
+        }
+
+        # HTTP Response
+        response = self.client.post(
+            path=ARTICLE_DETAIL_URL,
+            data=comment_data
+        )
+
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=ARTICLE_DETAIL_URL
         )
@@ -1,12 +1,22 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
+from django.test import SimpleTestCase, TestCase
 
+from accounts.tests.utils import fast_password_hashers
 from articles.models import Article
-from articles.tests.utils import TestUtils
+from articles.tests.utils import (
+    ARTICLE_LIST_URL,
+    ArticleTestDataMixin,
+    check_login_redirect,
+    login_with_session_cookie
+)
+from articles.views import ArticleListView
 
+# Project custom user model
+User = get_user_model()
 
-class ArticleListTestCase(TestCase):
+
+@fast_password_hashers
+class ArticleListTestCase(ArticleTestDataMixin, TestCase):
     """
     A Django 'TestCase' subclass that contains unit tests for the
     "ArticleListView" view.
@@ -15,13 +25,6 @@ class ArticleListTestCase(TestCase):
     expected HTTP response codes, rendering the correct templates, and
     displaying the list of available articles in the database.
     """
-    # URLs
-    LOGIN_URL = reverse('login')
-    ARTICLE_LIST_URL = reverse('article_list')
-
-    # Utility methods
-    utils = TestUtils()
-
     @classmethod
     def setUpTestData(cls):
         """
@@ -29,61 +32,31 @@ class ArticleListTestCase(TestCase):
         class, this method is run and set up the test data that all the tests
         will use.
 
-        This method creates a test user and several test articles using
-        the Django ORM. These test objects are saved to the database and can
-        be used in the tests to ensure that the 'ArticleListView' view
-        is functioning correctly.
+        This method adds several test articles, created using the Django ORM,
+        to the test user set up by 'ArticleTestDataMixin'. These test objects
+        are saved to the database and can be used in the tests to ensure that
+        the 'ArticleListView' view is functioning correctly.
         """
-        # Project custom user model
-        user_model = get_user_model()
-
-        # Test user
-        cls.user = user_model.objects.create_user(
-            username='test_user',
-            password='test_pass',
-            email='test@example.net',
-            age=18
-        )
+        super().setUpTestData()
 
         # Test articles
-        Article.objects.create(
-            title='Test Article 1',
-            body='Test Body 1',
-            author=cls.user
-        )
-
-        Article.objects.create(
-            title='Test Article 2',
-            body='Test Body 2',
-            author=cls.user
-        )
-
-        Article.objects.create(
-            title='Test Article 3',
-            body='Test Body 3',
-            author=cls.user
-        )
-
-    def test_article_list_render_user_not_authenticated(self):
-        """
-        This method tests the behavior of the "ArticleListView" view for
-        non-authenticated users.
-
-        It sends an HTTP GET request to the "ArticleListView" URL and verifies
-        that the view redirects to the login page as expected. It also checks
-        the proper template render.
-        """
-        # HTTP response
-        response = self.client.get(
-            path=self.ARTICLE_LIST_URL,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.ARTICLE_LIST_URL
-        )
+        cls.articles = Article.objects.bulk_create([
+            Article(
+                title='Test Article 1',
+                body='Test Body 1',
+                author=cls.user
+            ),
+            Article(
+                title='Test Article 2',
+                body='Test Body 2',
+                author=cls.user
+            ),
+            Article(
+                title='Test Article 3',
+                body='Test Body 3',
+                author=cls.user
+            )
+        ])
 
     def test_article_list_render_user_authenticated(self):
         """
@@ -95,16 +68,16 @@ class ArticleListTestCase(TestCase):
         HTTP 200 (OK) status code. It also checks that the full articles list
         is sent in the context and the proper template rendering.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
-        # HTTP Response
-        response = self.client.get(
-            path=self.ARTICLE_LIST_URL,
-            follow=True
-        )
+        # HTTP Response, checking the number of database queries: session,
+        # user, the articles count for the pagination and the articles list
+        # with their authors.
+        with self.assertNumQueries(4):
+            response = self.client.get(path=ARTICLE_LIST_URL)
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -113,9 +86,9 @@ class ArticleListTestCase(TestCase):
         )
 
         # Checks that the view sends the full articles list in the context.
-        self.assertQuerysetEqual(
+        self.assertQuerySetEqual(
             qs=response.context['article_list'],
-            values=Article.objects.all(),
+            values=self.articles,
             ordered=False
         )
 
@@ -124,3 +97,101 @@ class ArticleListTestCase(TestCase):
             response=response,
             template_name='articles/article_list.html'
         )
+
+    def test_article_list_paginated(self):
+        """
+        It is a method that tests the pagination of the "ArticleListView"
+        view.
+
+        This method adds enough test articles to fill more than one page,
+        sends HTTP GET requests for the first and the second page of the
+        "ArticleListView" URL, and verifies the number of articles sent in
+        the context of each page.
+        """
+        Article.objects.bulk_create([
+            Article(
+                title=f'Extra Test Article {number}',
+                body='Test Body',
+                author=self.user
+            )
+            for number in range(ArticleListView.paginate_by)
+        ])
+
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
+        )
+
+        for page, articles_count in ((1, ArticleListView.paginate_by), (2, 3)):
+            with self.subTest(page=page):
+                # HTTP Response
+                response = self.client.get(
+                    path=ARTICLE_LIST_URL,
+                    data={
+                        'page': page
+                    }
+                )
+
+                # Checks that the page includes the expected articles count
+                self.assertTrue(response.context['is_paginated'])
+                self.assertEqual(
+                    first=len(response.context['article_list']),
+                    second=articles_count
+                )
+
+    def test_article_list_queries_count_constant(self):
+        """
+        It is a method that tests that the "ArticleListView" view runs the
+        same number of database queries however many articles (and authors)
+        are listed.
+
+        This method adds articles of other test users and verifies that the
+        view still runs the queries of an articles list with one author.
+        """
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
+        )
+
+        # More test articles, each one with its own author
+        authors = User.objects.bulk_create([
+            User(
+                username=f'test_author_{number}',
+                email=f'test_author_{number}@example.net'
+            )
+            for number in range(5)
+        ])
+        Article.objects.bulk_create([
+            Article(
+                title=f'{author.username} Article',
+                body='Test Body',
+                author=author
+            )
+            for author in authors
+        ])
+
+        # Checks the number of database queries: session, user, the articles
+        # count for the pagination and the articles list with their authors.
+        with self.assertNumQueries(4):
+            self.client.get(path=ARTICLE_LIST_URL)
+
+
+class ArticleListAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'ArticleListView' view for anonymous users."""
+    def test_article_list_render_user_not_authenticated(self):
+        """
+        This method tests the behavior of the "ArticleListView" view for
+        non-authenticated users.
+
+        It sends an HTTP GET request to the "ArticleListView" URL and verifies
+        that the view redirects to the login page as expected.
+        """
+        # HTTP response
+        response = self.client.get(path=ARTICLE_LIST_URL)
+
+        # Checks that there is a redirect to the login page
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=ARTICLE_LIST_URL
+        )
@@ -1,13 +1,28 @@
 from django.contrib.auth import get_user_model
-from django.forms import ModelForm, model_to_dict
-from django.test import TestCase
-from django.urls import reverse
-
-from articles.models import Article
-from articles.tests.utils import TestUtils
-
-
-class ArticleUpdateTestCase(TestCase):
+from django.forms import ModelForm
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase
+)
+
+from accounts.tests.utils import fast_password_hashers
+from articles.tests.utils import (
+    ARTICLE_DETAIL_URL,
+    ARTICLE_UPDATE_URL,
+    ArticleTestDataMixin,
+    check_login_redirect,
+    create_session_cookie,
+    login_with_session_cookie
+)
+from articles.views import ArticleUpdateView
+
+# Project custom user model
+User = get_user_model()
+
+
+@fast_password_hashers
+class ArticleUpdateTestCase(ArticleTestDataMixin, TestCase):
     """
     A Django 'TestCase' subclass that contains unit tests for the
     'ArticleUpdateView' view.
@@ -16,23 +31,11 @@ class ArticleUpdateTestCase(TestCase):
     the expected HTTP response codes, rendering the correct templates, and
     allowing an article edition.
     """
-    # URLs
-    LOGIN_URL = reverse('login')
-    ARTICLE_UPDATE_URL = reverse(
-        viewname='article_edit',
-        kwargs={
-            'pk': 1
-        }
-    )
-    ARTICLE_DETAIL_URL = reverse(
-        viewname='article_detail',
-        kwargs={
-            'pk': 1
-        }
-    )
+    # Request factory for the tests that only check the view response and
+    # context, calling the view directly without the middleware stack
+    factory = RequestFactory()
 
-    # Utility methods
-    utils = TestUtils()
+    create_article = True
 
     @classmethod
     def setUpTestData(cls):
@@ -41,56 +44,25 @@ class ArticleUpdateTestCase(TestCase):
         class, this method is run and set up the test data that all the tests
         will use.
 
-        This method creates a test user and article using the Django ORM.
+        This method adds a second test user, created using the Django ORM, to
+        the test user and article set up by 'ArticleTestDataMixin'.
         These test objects are saved to the database and can be used in the
         tests to ensure that the 'ArticleUpdateView' view is functioning
         correctly.
         """
-        # Project custom user model
-        user_model = get_user_model()
+        super().setUpTestData()
 
-        # Test user
-        cls.user = user_model.objects.create_user(
-            username='test_user',
-            password='test_pass',
-            email='test@example.net',
-            age=18
-        )
-
-        cls.user_2 = user_model.objects.create_user(
+        # Second test user, not the author of the test article
+        cls.user_2 = User.objects.create_user(
             username='test_user_2',
             password='test_pass',
             email='test2@example.net',
             age=81
         )
 
-        # Test article
-        cls.test_article = Article.objects.create(
-            pk=1,
-            title='Test Article',
-            body='Test Body',
-            author=cls.user
-        )
-
-    def test_update_form_render_user_not_authenticated(self):
-        """
-        This method tests the behavior of the "ArticleUpdateView" view when a
-        non-authenticated user tries to access an article update form.
-
-        It sends an HTTP GET request to the "ArticleUpdateView" view URL and
-        verifies that the view redirects to the login page as expected.
-        """
-        # HTTP Response
-        response = self.client.get(
-            path=self.ARTICLE_UPDATE_URL,
-            follow=True
-        )
-
-        # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
-            response=response,
-            target_url=self.ARTICLE_UPDATE_URL
-        )
+        # Session cookie of the second test user, logged in only once for
+        # this test case
+        cls.session_cookie_2 = create_session_cookie(user=cls.user_2)
 
     def test_update_form_render_user_unauthorized(self):
         """
@@ -102,13 +74,13 @@ class ArticleUpdateTestCase(TestCase):
         verifies that the server returns an HTTP 403 status code as expected.
         """
         # Log in with the second test user
-        self.client.login(
-            username='test_user_2',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie_2
         )
 
         # HTTP Response
-        response = self.client.get(path=self.ARTICLE_UPDATE_URL)
+        response = self.client.get(path=ARTICLE_UPDATE_URL)
 
         # Checks that an HTTP 403 (Forbidden) status code is returned.
         self.assertEqual(
@@ -122,20 +94,24 @@ class ArticleUpdateTestCase(TestCase):
         authenticated user access the update form for an article that is of
         their authorship.
 
-        It sends an HTTP GET request to the "ArticleUpdateView" view URL while
-        an authenticated (and authorized) user is logged in and verifies that
-        the view returns an HTTP 200 (OK) status code.
+        It calls the "ArticleUpdateView" view with an HTTP GET request built by
+        the request factory for an authenticated (and authorized) user and
+        verifies that the view returns an HTTP 200 (OK) status code.
         It also checks that the view renders the correct template and sends
         a 'ModelForm' form in the context.
         """
-        # Log in with the first test user
-        self.client.login(
-            username='test_user',
-            password='test_pass'
-        )
-
-        # HTTP Response
-        response = self.client.get(path=self.ARTICLE_UPDATE_URL)
+        request = self.factory.get(path=ARTICLE_UPDATE_URL)
+        request.user = self.user
+
+        # HTTP Response, checking that the view renders the correct template
+        # retrieving the article only once, for both the author check and the
+        # form.
+        with self.assertNumQueries(1):
+            response = ArticleUpdateView.as_view()(request, pk=1)
+            with self.assertTemplateUsed(
+                template_name='articles/article_edit.html'
+            ):
+                response.render()
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -143,25 +119,19 @@ class ArticleUpdateTestCase(TestCase):
             second=200
         )
 
-        # Checks that the view renders the correct template.
-        self.assertTemplateUsed(
-            response=response,
-            template_name='articles/article_edit.html'
-        )
-
         # Checks that the view sends a 'ModelForm' form in the context
         self.assertIsInstance(
-            obj=response.context['form'],
+            obj=response.context_data['form'],
             cls=ModelForm
         )
 
         # Checks that the article update form includes the correct information
-        article_partial_data = model_to_dict(
-            instance=self.test_article,
-            fields=['title', 'body']
-        )
+        article_partial_data = {
+            'title': self.article.title,
+            'body': self.article.body
+        }
         self.assertEqual(
-            first=response.context['form'].initial,
+            first=response.context_data['form'].initial,
             second=article_partial_data
         )
 
@@ -181,21 +151,21 @@ class ArticleUpdateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.ARTICLE_UPDATE_URL,
-            data=article_update,
-            follow=True
+            path=ARTICLE_UPDATE_URL,
+            data=article_update
         )
 
         # Checks that there is a redirect to the login page
-        self.utils.check_login_redirect(
+        check_login_redirect(
+            testcase=self,
             response=response,
-            target_url=self.ARTICLE_UPDATE_URL
+            target_url=ARTICLE_UPDATE_URL
         )
 
         # Checks that the article has not been modified
-        self.test_article.refresh_from_db()  # Updated test article
+        self.article.refresh_from_db()  # Updated test article
         self.assertNotEqual(
-            first=self.test_article,
+            first=self.article,
             second=article_update
         )
 
@@ -209,9 +179,9 @@ class ArticleUpdateTestCase(TestCase):
         verifies that the server returns an HTTP 403 status code as expected.
         """
         # Log in with the second test user
-        self.client.login(
-            username='test_user_2',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie_2
         )
 
         article_update = {
@@ -221,7 +191,7 @@ class ArticleUpdateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.ARTICLE_UPDATE_URL,
+            path=ARTICLE_UPDATE_URL,
             data=article_update
         )
 
@@ -242,9 +212,9 @@ class ArticleUpdateTestCase(TestCase):
         the errors in their respective fields.
         """
         # Log in with the first test user
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         article_update = {
@@ -252,11 +222,13 @@ class ArticleUpdateTestCase(TestCase):
             'body': 'Updated Body'
         }
 
-        # HTTP Response
-        response = self.client.post(
-            path=self.ARTICLE_UPDATE_URL,
-            data=article_update
-        )
+        # HTTP Response, checking the number of database queries: session,
+        # user and article, retrieved only once.
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                path=ARTICLE_UPDATE_URL,
+                data=article_update
+            )
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -288,9 +260,9 @@ class ArticleUpdateTestCase(TestCase):
         )
 
         # Checks that the article has not been modified
-        self.test_article.refresh_from_db()  # Updated test article
+        self.article.refresh_from_db()  # Updated test article
         self.assertNotEqual(
-            first=self.test_article,
+            first=self.article,
             second=article_update
         )
 
@@ -306,9 +278,9 @@ class ArticleUpdateTestCase(TestCase):
         database.
         """
         # Log in with the first test user
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        login_with_session_cookie(
+            client=self.client,
+            session_cookie=self.session_cookie
         )
 
         article_update = {
@@ -318,7 +290,7 @@ class ArticleUpdateTestCase(TestCase):
 
         # HTTP Response
         response = self.client.post(
-            path=self.ARTICLE_UPDATE_URL,
+            path=ARTICLE_UPDATE_URL,
             data=article_update,
             follow=True
         )
@@ -326,7 +298,7 @@ class ArticleUpdateTestCase(TestCase):
         # Checks that there is a redirect to the article detail page
         self.assertRedirects(
             response=response,
-            expected_url=self.ARTICLE_DETAIL_URL,
+            expected_url=ARTICLE_DETAIL_URL,
             status_code=302,
             target_status_code=200
         )
@@ -338,11 +310,11 @@ class ArticleUpdateTestCase(TestCase):
         )
 
         # Checks that the article has been modified
-        self.test_article.refresh_from_db()
-        article_partial_data = model_to_dict(
-            instance=self.test_article,
-            fields=['title', 'body']
-        )
+        self.article.refresh_from_db()
+        article_partial_data = {
+            'title': self.article.title,
+            'body': self.article.body
+        }
 
         self.assertEqual(
             first=article_partial_data,
@@ -352,5 +324,61 @@ class ArticleUpdateTestCase(TestCase):
         # Checks that the article instance is included in the context
         self.assertEqual(
             first=response.context['article'],
-            second=self.test_article
+            second=self.article
+        )
+
+    def test_update_form_submit_queries_user_authorized(self):
+        """
+        This method tests the number of database queries of the
+        "ArticleUpdateView" view when an authenticated user submits the update
+        form of an article that is of their authorship with valid data.
+
+        It calls the "ArticleUpdateView" view with an HTTP POST request built by
+        the request factory and checks that the article is retrieved only once,
+        for both the author check and the update.
+        """
+        article_update = {
+            'title': 'Updated Title',
+            'body': 'Updated Body'
+        }
+        request = self.factory.post(
+            path=ARTICLE_UPDATE_URL,
+            data=article_update
+        )
+        request.user = self.user
+
+        # HTTP Response, checking the number of database queries: article
+        # retrieval and update.
+        with self.assertNumQueries(2):
+            response = ArticleUpdateView.as_view()(request, pk=1)
+
+        # Checks that there is a redirect to the article detail page
+        self.assertEqual(
+            first=response.status_code,
+            second=302
+        )
+        self.assertEqual(
+            first=response.url,
+            second=ARTICLE_DETAIL_URL
+        )
+
+
+class ArticleUpdateAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'ArticleUpdateView' view for anonymous users."""
+    def test_update_form_render_user_not_authenticated(self):
+        """
+        This method tests the behavior of the "ArticleUpdateView" view when a
+        non-authenticated user tries to access an article update form.
+
+        It sends an HTTP GET request to the "ArticleUpdateView" view URL and
+        verifies that the view redirects to the login page as expected.
+        """
+        # HTTP Response
+        response = self.client.get(path=ARTICLE_UPDATE_URL)
+
+        # Checks that there is a redirect to the login page
+        check_login_redirect(
+            testcase=self,
+            response=response,
+            target_url=ARTICLE_UPDATE_URL
         )
@@ -1,32 +1,128 @@
-from django.test import TestCase
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client
 from django.urls import reverse
 
+from articles.models import Article
 
-class TestUtils(TestCase):
+# Project custom user model
+User = get_user_model()
+
+# URLs shared by the article test cases, resolved once at import time.
+# The detail, update and delete URLs point to the test article with pk=1.
+LOGIN_URL = reverse('login')
+ARTICLE_LIST_URL = reverse('article_list')
+NEW_ARTICLE_URL = reverse('article_new')
+ARTICLE_DETAIL_URL = reverse(viewname='article_detail', kwargs={'pk': 1})
+ARTICLE_UPDATE_URL = reverse(viewname='article_edit', kwargs={'pk': 1})
+ARTICLE_DELETE_URL = reverse(viewname='article_delete', kwargs={'pk': 1})
+
+
+def check_login_redirect(testcase, response, target_url):
     """
-    A utility class for the Django project unit tests.
+    Check that the given response redirects to the login page for the
+    specified target URL.
+
+    The login page itself is not requested: its rendering is covered by the
+    accounts app login tests.
+
+    It is a utility function for the Django project unit tests, available for
+    multiple test cases.
 
-    This class extends the Django 'TestCase' class and provides utility methods
-    available for multiple test cases.
+    :param testcase: The test case running the assertions.
+    :param response: The HTTP response.
+    :param target_url: The target URL to redirect to after successful login.
     """
-    LOGIN_URL = reverse('login')
+    redirect_url = f'{LOGIN_URL}?next={target_url}'
+    testcase.assertRedirects(
+        response=response,
+        expected_url=redirect_url,
+        status_code=302,
+        fetch_redirect_response=False
+    )
 
-    def check_login_redirect(self, response, target_url):
-        """
-        Check that the given response redirects to the login page for the
-        specified target URL.
 
-        :param response: The HTTP response.
-        :param target_url: The target URL to redirect to after successful login.
+def create_test_article(author):
+    """
+    Create the test article that the detail, update and delete URLs point to.
+
+    It is a utility function for the Django project unit tests, meant to be
+    called from the 'setUpTestData' method of the test cases.
+
+    :param author: The user set as the article author.
+    :return: The created article, with pk=1.
+    """
+    return Article.objects.create(
+        pk=1,
+        title='Test Article',
+        body='Test Body',
+        author=author
+    )
+
+
+def create_session_cookie(user):
+    """
+    Log the given user in on a throwaway test client and return the value of
+    its session cookie.
+
+    It is a utility function for the Django project unit tests, meant to be
+    called from the 'setUpTestData' method of the test cases so that the unit
+    tests reuse a single session instead of logging in again each time.
+
+    :param user: The user to log in.
+    :return: The session cookie value.
+    """
+    client = Client()
+    client.force_login(user=user)
+    return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+
+def login_with_session_cookie(client, session_cookie):
+    """
+    Authenticate the given test client with a session cookie created by
+    'create_session_cookie'.
+
+    :param client: The test client to authenticate.
+    :param session_cookie: The session cookie value.
+    """
+    client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+
+
+class ArticleTestDataMixin:
+    """
+    A mixin for the article views 'TestCase' subclasses that sets up the test
+    data they share in 'setUpTestData'.
+
+    It creates a test user and logs it in once, keeping its session cookie
+    to be used with 'login_with_session_cookie'. Test cases that need more
+    data extend 'setUpTestData', calling this implementation first.
+
+    Attributes:
+        create_article: If True, the test article (pk=1) authored by the test
+            user is also created.
+    """
+    create_article = False
+
+    @classmethod
+    def setUpTestData(cls):
         """
-        redirect_url = f'{self.LOGIN_URL}?next={target_url}'
-        self.assertRedirects(
-            response=response,
-            expected_url=redirect_url,
-            status_code=302,
-            target_status_code=200
-        )
-        self.assertTemplateUsed(
-            response=response,
-            template_name='registration/login.html'
+        Create the test user, its session cookie and, if required by the test
+        case, the test article.
+        """
+        super().setUpTestData()
+
+        # Test user
+        cls.user = User.objects.create_user(
+            username='test_user',
+            password='test_pass',
+            email='test@example.net',
+            age=18
         )
+
+        # Session cookie of the test user, logged in only once for the test
+        # case instead of in every unit test.
+        cls.session_cookie = create_session_cookie(user=cls.user)
+
+        # Test article
+        if cls.create_article:
+            cls.article = create_test_article(author=cls.user)
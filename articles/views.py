@@ -1,5 +1,6 @@
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.urls import reverse, reverse_lazy
+from django.db.models import prefetch_related_objects
+from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic import ListView, DetailView, FormView, CreateView, \
     UpdateView, DeleteView
@@ -17,12 +18,31 @@ class ArticleListView(LoginRequiredMixin, ListView):
     mixin) and uses the template "article_list.html" to render the list of
     articles.
 
+    The articles are paginated, so each page only fetches a bounded number
+    of rows, however many articles there are.
+
     Attributes:
         model: The model that the view is using.
         template_name: The template name used to render the view.
+        paginate_by: The number of articles shown on each page.
     """
     model = Article
     template_name = 'articles/article_list.html'
+    paginate_by = 25
+
+    def get_queryset(self):
+        """
+        This method returns the articles to list, with their author joined in
+        the same query and only loading the fields shown in the template.
+
+        :return: A queryset of 'Article' objects.
+        """
+        return super().get_queryset().only(
+            'title',
+            'body',
+            'date',
+            'author__username'
+        )
 
 
 class ArticleDetailGet(DetailView):
@@ -34,11 +54,12 @@ class ArticleDetailGet(DetailView):
     adding comments to it.
 
     Attributes:
-        model: The model that the view is using.
+        queryset: The articles queryset, fetching the article comments (and
+            their authors) with a single extra query.
         template_name: The template name used to render the view.
 
     """
-    model = Article
+    queryset = Article.objects.with_comments()
     template_name = 'articles/article_detail.html'
 
     def get_context_data(self, **kwargs):
@@ -104,22 +125,40 @@ class ArticleDetailPost(SingleObjectMixin, FormView):
         comment.save()
         return super().form_valid(form)
 
+    def form_invalid(self, form):
+        """
+        A method called when the form submission is invalid.
+
+        The article detail page is rendered again with the form errors, so
+        the comments (and their authors) of the article already retrieved
+        in 'post' are fetched with a single query before calling the
+        parent's implementation of the method.
+
+        :param form: The form being submitted.
+        :return: The HTTP response.
+        """
+        prefetch_related_objects([self.object], 'comment_set')
+        return super().form_invalid(form)
+
     def get_success_url(self):
         """
         This method returns the URL for the detail page of the commented
         article after successful comment form submission.
 
+        The commented article is the one already retrieved in 'post', so it
+        is not queried again, and its URL is built by 'get_absolute_url' like
+        for the other article views.
+
         :return: It returns the URL for the detail page of the
             commented article.
         """
-        article = self.get_object()
-        success_url = reverse(
-            viewname='article_detail',
-            kwargs={
-                'pk': article.pk
-            }
-        )
-        return success_url
+        return self.object.get_absolute_url()
+
+
+# Views handling the GET and POST requests of 'ArticleDetailView', created
+# once instead of on every request
+ARTICLE_DETAIL_GET_VIEW = ArticleDetailGet.as_view()
+ARTICLE_DETAIL_POST_VIEW = ArticleDetailPost.as_view()
 
 
 class ArticleDetailView(LoginRequiredMixin, View):
@@ -142,8 +181,7 @@ class ArticleDetailView(LoginRequiredMixin, View):
         :param kwargs: Keyword arguments.
         :return: The HTTP response.n:
         """
-        view = ArticleDetailGet.as_view()
-        return view(request, *args, **kwargs)
+        return ARTICLE_DETAIL_GET_VIEW(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
         """
@@ -156,8 +194,7 @@ class ArticleDetailView(LoginRequiredMixin, View):
         :param kwargs: Keyword arguments.
         :return: The HTTP response.
         """
-        view = ArticleDetailPost.as_view()
-        return view(request, *args, **kwargs)
+        return ARTICLE_DETAIL_POST_VIEW(request, *args, **kwargs)
 
 
 class ArticleCreateView(LoginRequiredMixin, CreateView):
@@ -194,7 +231,31 @@ class ArticleCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 
-class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class CachedObjectMixin:
+    """
+    A mixin for the single object views that retrieves their object only
+    once per request.
+
+    The 'test_func' of the 'UserPassesTestMixin' views and the view handlers
+    both call 'get_object', so without this mixin the object is queried
+    twice for each request.
+    """
+
+    def get_object(self, queryset=None):
+        """
+        This method returns the object of the view, retrieving it from the
+        database only the first time it is called.
+
+        :param queryset: The queryset to retrieve the object from.
+        :return: The view object.
+        """
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset=queryset)
+        return self._object
+
+
+class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin,
+                        CachedObjectMixin, UpdateView):
     """
     A class-based view for updating an article.
 
@@ -202,7 +263,8 @@ class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     that only authenticated users can access it and the
     'UserPassesTestMixin' mixin to ensure that only the author of an
     article can edit its info. It also uses the built-in Django generic
-    view 'UpdateView' to handle the update of an existing article.
+    view 'UpdateView' to handle the update of an existing article, and the
+    'CachedObjectMixin' mixin to retrieve the article only once.
 
     Attributes:
         model: The model to use for the view.
@@ -228,7 +290,8 @@ class ArticleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return obj.author == self.request.user
 
 
-class ArticleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class ArticleDeleteView(LoginRequiredMixin, UserPassesTestMixin,
+                        CachedObjectMixin, DeleteView):
     """
     A class-based view for deleting an article.
 
@@ -236,7 +299,8 @@ class ArticleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     only authenticated users can access it and the 'UserPassesTestMixin'
     mixin to ensure that only the author of an article can delete it.
     It also uses the built-in Django generic view 'DeleteView' to handle
-    the article deletion process.
+    the article deletion process, and the 'CachedObjectMixin' mixin to
+    retrieve the article only once.
 
     Attributes:
         - model: The model to use for the view.
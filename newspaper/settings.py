@@ -89,8 +89,16 @@ WSGI_APPLICATION = 'newspaper.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
+# Database connections are kept open and reused by the following requests
+# for CONN_MAX_AGE seconds (600 by default; 0 closes them after each
+# request). The health checks replace connections closed by the database
+# server before reusing them.
 DATABASES = {
-    'default': env.dj_db_url('DATABASE_URL')
+    'default': env.dj_db_url(
+        'DATABASE_URL',
+        conn_max_age=env.int('CONN_MAX_AGE', 600),
+        conn_health_checks=True
+    )
 }
 
 
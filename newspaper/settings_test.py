@@ -0,0 +1,30 @@
+"""
+Django settings for running the newspaper project test suite.
+
+They extend the project settings, replacing the database with an in-memory
+SQLite database, so the many small transactions issued by the unit tests
+never wait on disk writes.
+
+Usage: python manage.py test --settings=newspaper.settings_test
+"""
+
+import os
+
+# The project settings read the database from DATABASE_URL, which is then
+# replaced below, so the test settings do not need a real database URL.
+os.environ.setdefault('DATABASE_URL', 'sqlite://:memory:')
+
+from newspaper.settings import *  # noqa: E402, F401, F403
+
+# Database
+# https://docs.djangoproject.com/en/4.1/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': ':memory:'
+        }
+    }
+}
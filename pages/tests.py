@@ -1,15 +1,22 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
+from accounts.tests.utils import fast_password_hashers
 
+# Custom user model used by this project
+User = get_user_model()
+
+HOMEPAGE_URL = reverse('home')
+
+
+@fast_password_hashers
 class HomeViewTestCase(TestCase):
     """
     Unit test case for the 'HomeView' class that handles the website
     homepage render and other general-purpose pages.
     """
-    HOMEPAGE_URL = reverse('home')
-
     @classmethod
     def setUpTestData(cls):
         """
@@ -17,23 +24,31 @@ class HomeViewTestCase(TestCase):
         all unit tests. It is called only once for this test case, and the
         created objects are shared among all unit tests in this test case.
         """
-        # Custom user model used by this project
-        user_model = get_user_model()
-
         # Test user
-        cls.user = user_model.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             password='test_pass',
             email='test@example.net',
             age=18
         )
 
-    def test_homepage_render_user_not_authenticated(self):
+    def setUp(self):
         """
-        Checks that a non-authenticated user can access the website homepage.
+        Clears the cache before each unit test, so the homepage is not served
+        from a page cached by a previous test.
         """
-        # HTTP Response
-        response = self.client.get(self.HOMEPAGE_URL)
+        cache.clear()
+
+    def test_homepage_render_user_authenticated(self):
+        """
+        Checks that an authenticated user can access the website homepage.
+        """
+        self.client.force_login(user=self.user)
+
+        # HTTP Response, checking the number of database queries: session
+        # and user.
+        with self.assertNumQueries(2):
+            response = self.client.get(HOMEPAGE_URL)
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -47,17 +62,39 @@ class HomeViewTestCase(TestCase):
             template_name='home.html'
         )
 
-    def test_homepage_render_user_authenticated(self):
+
+    def test_homepage_not_cached_user_authenticated(self):
         """
-        Checks that an authenticated user can access the website homepage.
+        Checks that the homepage is rendered again on every request of an
+        authenticated user, instead of being served from the page cache.
         """
-        self.client.login(
-            username='test_user',
-            password='test_pass'
+        self.client.force_login(user=self.user)
+        self.client.get(HOMEPAGE_URL)
+
+        # HTTP Response
+        response = self.client.get(HOMEPAGE_URL)
+
+        # Verify that the view renders the template again.
+        self.assertTemplateUsed(
+            response=response,
+            template_name='home.html'
         )
 
+class HomeViewAnonymousTestCase(SimpleTestCase):
+    """Unit tests of the 'HomeView' view for anonymous users."""
+    def setUp(self):
+        """
+        Clears the cache before each unit test, so the homepage is not served
+        from a page cached by a previous test.
+        """
+        cache.clear()
+
+    def test_homepage_render_user_not_authenticated(self):
+        """
+        Checks that a non-authenticated user can access the website homepage.
+        """
         # HTTP Response
-        response = self.client.get(self.HOMEPAGE_URL)
+        response = self.client.get(HOMEPAGE_URL)
 
         # Checks that an HTTP 200 (OK) status code is returned.
         self.assertEqual(
@@ -69,4 +106,27 @@ class HomeViewTestCase(TestCase):
         self.assertTemplateUsed(
             response=response,
             template_name='home.html'
-        )
\ No newline at end of file
+        )
+
+    def test_homepage_cached(self):
+        """
+        Checks that the homepage is cached, so a second request does not
+        render the template again.
+        """
+        # First HTTP Response, rendered and cached
+        self.client.get(HOMEPAGE_URL)
+
+        # Second HTTP Response
+        response = self.client.get(HOMEPAGE_URL)
+
+        # Checks that an HTTP 200 (OK) status code is returned.
+        self.assertEqual(
+            first=response.status_code,
+            second=200
+        )
+
+        # Verify that the page is served from the cache.
+        self.assertTemplateNotUsed(
+            response=response,
+            template_name='home.html'
+        )
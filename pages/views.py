@@ -1,3 +1,5 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from django.views.generic import TemplateView
 
 
@@ -5,5 +7,25 @@ class HomeView(TemplateView):
     """
     A class-based view that inherits from the Django 'TemplateView' generic
     view and is responsible for rendering the homepage template of the website.
+
+    The page rendered for anonymous users is cached for a minute. As the
+    navigation bar shows the logged-in user, the page rendered for
+    authenticated users is never cached.
     """
     template_name = 'home.html'
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Serves anonymous users from the page cache, and renders the page for
+        authenticated users on every request.
+        """
+        if request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        return self.anonymous_dispatch(request, *args, **kwargs)
+
+    @method_decorator(cache_page(60))
+    def anonymous_dispatch(self, request, *args, **kwargs):
+        """
+        Dispatches an anonymous user request, caching the response.
+        """
+        return super().dispatch(request, *args, **kwargs)